@@ -2,90 +2,150 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import io
 import os
+import re
 import sys
-import urllib.error
-import urllib.parse
-import urllib.request
-from datetime import datetime, timezone
+import threading
+import time
+
+# Avoid importing typing at runtime; type checkers treat this name as True.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import http.client
+    from collections.abc import Callable
+    from typing import Any, NoReturn, TextIO
 
 __version__ = "1.0.0"
 
-BASE_URL = "https://skillsmp.com/api/v1/skills"
+API_HOST = "skillsmp.com"
+BASE_PATH = "/api/v1/skills"
+BASE_URL = f"https://{API_HOST}{BASE_PATH}"
 REQUEST_TIMEOUT = 30
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 0.25
+RETRY_STATUSES = frozenset((502, 503, 504))
 DESC_DISPLAY_LIMIT = 200
 DESC_PLAIN_LIMIT = 120
+SORT_KEYS = frozenset(("stars", "recent"))
+DEFAULT_JOBS = 4
+MAX_JOBS = 16
 
 # --- TTY / formatting helpers ---
 
 
+_stderr_tty: bool | None = None
+
+
 def _stderr_is_tty() -> bool:
-    return hasattr(sys.stderr, "isatty") and sys.stderr.isatty()
+    """Whether stderr is a terminal; checked once per process."""
+    global _stderr_tty
+    if _stderr_tty is None:
+        _stderr_tty = hasattr(sys.stderr, "isatty") and sys.stderr.isatty()
+    return _stderr_tty
 
 
-def _bold(text: str) -> str:
-    """Wrap text in bold escapes when stderr is a TTY."""
-    if _stderr_is_tty():
-        return f"\033[1m{text}\033[0m"
-    return text
+_BOLD_ON = "\033[1m"
+_BOLD_OFF = "\033[0m"
 
 
 # --- help texts ---
 
 
-def _concise_help() -> str:
-    return f"""\
-{_bold("skillsmp")} — search the SkillsMP marketplace for agent skills
+# Rendered once at import, with and without bold escapes.
+_CONCISE_HELP_ANSI = f"""\
+{_BOLD_ON}skillsmp{_BOLD_OFF} — search the SkillsMP marketplace for agent skills
 
-{_bold("Examples:")}
+{_BOLD_ON}Examples:{_BOLD_OFF}
   skillsmp terraform
   skillsmp --ai "how to optimize database queries"
 
 Run "skillsmp --help" for all options.
 """
 
+_FULL_HELP_ANSI = f"""\
+{_BOLD_ON}skillsmp{_BOLD_OFF} — search the SkillsMP marketplace for agent skills
 
-def _full_help() -> str:
-    return f"""\
-{_bold("skillsmp")} — search the SkillsMP marketplace for agent skills
-
-{_bold("Usage:")}
+{_BOLD_ON}Usage:{_BOLD_OFF}
   skillsmp [flags] <query ...>
   skillsmp --ai [flags] <query ...>
-
-{_bold("Search modes:")}
-  (default)       Keyword search — fast, supports pagination and sorting
-  -a, --ai        AI semantic search — natural language, relevance-scored
-
-{_bold("Flags:")}
-  -n, --limit N   Results per page (1-100, default: 10)
-  -p, --page N    Page number (default: 1)
-  -s, --sort KEY  Sort order: stars, recent (default: stars)
-  -j, --json      Machine-readable JSON output
-      --plain     One-line-per-result output for grep/awk
-  -h, --help      Show this help
-      --version   Show version
+  skillsmp [flags] --batch FILE
+
+{_BOLD_ON}Search modes:{_BOLD_OFF}
+  (default)         Keyword search — fast, supports pagination and sorting
+  -a, --ai          AI semantic search — natural language, relevance-scored
+
+{_BOLD_ON}Flags:{_BOLD_OFF}
+  -n, --limit N     Results per page (1-100, default: 10)
+  -p, --page N      Page number (default: 1)
+  -s, --sort KEY    Sort order: stars, recent (default: stars)
+  -j, --json        Machine-readable JSON output
+      --plain       One-line-per-result output for grep/awk
+      --batch FILE  Run one search per line of FILE ("-" for stdin)
+      --jobs N      Concurrent requests for --batch (1-16, default: 4)
+  -h, --help        Show this help
+      --version     Show version
 
   --limit, --page, and --sort apply to keyword search only.
 
-{_bold("Examples:")}
+{_BOLD_ON}Examples:{_BOLD_OFF}
   skillsmp terraform
   skillsmp --ai "how to optimize database queries"
   skillsmp --limit 5 --sort recent react testing
   skillsmp --json deployment
   skillsmp --plain react | grep facebook
+  skillsmp --json --batch queries.txt
 
-{_bold("Environment:")}
+{_BOLD_ON}Environment:{_BOLD_OFF}
   SKILLSMP_API_KEY    API key (required). Read from env or ~/.env.
 
 Docs: https://github.com/masonc15/skillsmp
 """
+_CONCISE_HELP_PLAIN = _CONCISE_HELP_ANSI.replace(_BOLD_ON, "").replace(_BOLD_OFF, "")
+_FULL_HELP_PLAIN = _FULL_HELP_ANSI.replace(_BOLD_ON, "").replace(_BOLD_OFF, "")
+
+
+def _concise_help() -> str:
+    return _CONCISE_HELP_ANSI if _stderr_is_tty() else _CONCISE_HELP_PLAIN
+
+
+def _full_help() -> str:
+    return _FULL_HELP_ANSI if _stderr_is_tty() else _FULL_HELP_PLAIN
+
+
+# --- output ---
+
+
+@functools.cache
+def _json_loads() -> Callable[[bytes], Any]:
+    """Return orjson.loads when installed, else json.loads (imported on first use)."""
+    try:
+        from orjson import loads  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        from json import loads
+    return loads
+
+
+def _emit_json(obj: dict | list) -> None:
+    """Write obj to stdout as JSON in a single write.
+
+    Indented for a terminal; compact when piped, where nobody reads the
+    whitespace and it can be a third of the bytes.
+    """
+    import json
+
+    if hasattr(sys.stdout, "isatty") and sys.stdout.isatty():
+        text = json.dumps(obj, indent=2)
+    else:
+        text = json.dumps(obj, separators=(",", ":"))
+    sys.stdout.write(text + "\n")
+
 
 # --- error handling ---
 
 
-def _die(msg: str) -> None:
+def _die(msg: str) -> NoReturn:
     print(f"skillsmp: {msg}", file=sys.stderr)
     print('Try "skillsmp --help" for usage.', file=sys.stderr)
     raise SystemExit(2)
@@ -94,83 +154,200 @@ def _die(msg: str) -> None:
 # --- API key ---
 
 
-def _load_env_file() -> None:
-    """Load SKILLSMP_API_KEY from ~/.env if it is not already set."""
-    if os.environ.get("SKILLSMP_API_KEY"):
-        return
+# `SKILLSMP_API_KEY=val` or `export SKILLSMP_API_KEY=val`; other lines never match.
+_DOTENV_API_KEY_RE = re.compile(
+    rb"^[ \t]*(?:export[ \t]+)?SKILLSMP_API_KEY[ \t]*=(.*)$", re.MULTILINE
+)
 
+
+def _dotenv_api_key() -> str:
+    """Return SKILLSMP_API_KEY from ~/.env, or "" if it is not set there."""
     env_path = os.path.join(os.path.expanduser("~"), ".env")
-    if not os.path.isfile(env_path):
-        return
+    try:
+        with open(env_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return ""
+
+    m = _DOTENV_API_KEY_RE.search(data)
+    if m is None:
+        return ""
+    return m.group(1).strip().strip(b"\"'").decode("utf-8", "replace")
 
-    with open(env_path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
 
-            # Handle `export VAR=val` and `VAR=val`.
-            if line.startswith("export "):
-                line = line[7:]
+# (SKILLSMP_API_KEY value it was resolved under, resolved key).
+_api_key: tuple[str, str] | None = None
 
-            key, _, val = line.partition("=")
-            key = key.strip()
-            val = val.strip().strip("\"'")
 
-            if key == "SKILLSMP_API_KEY" and key not in os.environ:
-                os.environ[key] = val
-                return
+def _reset_api_key_cache() -> None:
+    global _api_key
+    _api_key = None
 
 
 def _get_api_key() -> str:
-    key = os.environ.get("SKILLSMP_API_KEY", "")
-    if not key:
-        _load_env_file()
-        key = os.environ.get("SKILLSMP_API_KEY", "")
+    """Return the API key, resolving it from env or ~/.env once per process.
+
+    The cached key is dropped if SKILLSMP_API_KEY changes afterwards.
+    """
+    global _api_key
+    env_key = os.environ.get("SKILLSMP_API_KEY", "")
+    if _api_key is not None and _api_key[0] == env_key:
+        return _api_key[1]
+
+    key = env_key or _dotenv_api_key()
     if not key:
         _die("SKILLSMP_API_KEY not set. Export it or add to ~/.env.")
+    _api_key = (env_key, key)
     return key
 
 
 # --- API client ---
 
 
-def _api_request(
-    endpoint: str, params: dict, *, use_json_errors: bool = False
-) -> dict:
-    api_key = _get_api_key()
-    qs = urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
-    url = f"{BASE_URL}/{endpoint}?{qs}"
-    req = urllib.request.Request(
-        url,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "User-Agent": f"skillsmp-cli/{__version__}",
-        },
-    )
+# One keep-alive connection per thread; --batch workers each get their own.
+_local = threading.local()
+
+
+def _get_connection() -> http.client.HTTPSConnection:
+    """Return this thread's keep-alive connection to the API host.
+
+    Honors HTTPS_PROXY / NO_PROXY the same way urllib does, tunneling
+    through the proxy with CONNECT and sending any user:pass@ credentials
+    as Proxy-Authorization.
+    """
+    conn = getattr(_local, "connection", None)
+    if conn is not None:
+        return conn
+
+    import http.client
+    import urllib.request
+
+    proxy = urllib.request.getproxies().get("https")
+    if proxy and not urllib.request.proxy_bypass(API_HOST):
+        import base64
+        from urllib.parse import unquote, urlsplit
+
+        # urllib also accepts a bare "host:port" proxy.
+        if "://" not in proxy:
+            proxy = "http://" + proxy
+        proxy_url = urlsplit(proxy)
+        user, password = proxy_url.username, proxy_url.password
+        hostport = proxy_url.netloc.rpartition("@")[2]
+        tunnel_headers = {}
+        if user and password:
+            creds = f"{unquote(user)}:{unquote(password)}".encode()
+            tunnel_headers["Proxy-Authorization"] = (
+                "Basic " + base64.b64encode(creds).decode("ascii")
+            )
+        conn = http.client.HTTPSConnection(hostport, timeout=REQUEST_TIMEOUT)
+        conn.set_tunnel(API_HOST, headers=tunnel_headers)
+    else:
+        conn = http.client.HTTPSConnection(API_HOST, timeout=REQUEST_TIMEOUT)
+    _local.connection = conn
+    return conn
+
+
+def _send(path: str, headers: dict) -> tuple[int, str, bytes]:
+    """GET path over the shared connection and return (status, reason, body).
+
+    Connection resets and 502/503/504 responses are retried with
+    exponential backoff; the last attempt's response or error is final.
+    A reset on the first attempt is retried at once, since it usually
+    means the server closed an idle keep-alive connection. Any error that
+    escapes closes the connection and drops it from the thread, so the
+    next request never inherits a half-finished exchange.
+    """
+    import http.client
+
+    conn = _get_connection()
     try:
-        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as resp:
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        body: dict = {}
+        attempt = 1
+        while True:
+            last = attempt == MAX_ATTEMPTS
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+            except (
+                http.client.RemoteDisconnected,
+                ConnectionResetError,
+                BrokenPipeError,
+            ):
+                conn.close()
+                if last:
+                    raise
+                if attempt == 1:
+                    attempt += 1
+                    continue
+            else:
+                body = resp.read()
+                if last or resp.status not in RETRY_STATUSES:
+                    return resp.status, resp.reason, body
+            time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            attempt += 1
+    except BaseException:
+        conn.close()
+        _local.connection = None
+        raise
+
+
+@functools.lru_cache(maxsize=1)
+def _request_headers(api_key: str) -> dict[str, str]:
+    """Build the per-request headers once per API key; callers must not mutate."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "User-Agent": f"skillsmp-cli/{__version__}",
+    }
+
+
+class _APIError(Exception):
+    """A request that failed; str() is the stderr message."""
+
+    def __init__(self, message: str, payload: dict) -> None:
+        super().__init__(message)
+        # What --json mode prints instead: {"error": ..., optionally "code": ...}.
+        self.payload = payload
+
+
+def _fetch(endpoint: str, params: dict) -> dict:
+    """GET an API endpoint and return the parsed body, or raise _APIError."""
+    import http.client
+    import urllib.parse
+
+    headers = _request_headers(_get_api_key())
+    qs = urllib.parse.urlencode([(k, v) for k, v in params.items() if v is not None])
+    try:
+        status, reason, body = _send(f"{BASE_PATH}/{endpoint}?{qs}", headers)
+    except (OSError, http.client.HTTPException) as e:
+        raise _APIError(f"network error: {e}", {"error": str(e)}) from None
+
+    # http.client does not follow redirects; a 3xx is as unusable as a 4xx.
+    if not 200 <= status < 300:
+        err: dict = {}
         try:
-            body = json.loads(e.read())
+            err = _json_loads()(body).get("error", {})
         except Exception:
             pass
-        err = body.get("error", {})
-        msg = err.get("message", e.reason)
-        if use_json_errors:
-            json.dump({"error": msg, "code": e.code}, sys.stdout, indent=2)
-            print()
-        else:
-            print(f"skillsmp: API error ({e.code}): {msg}", file=sys.stderr)
-        raise SystemExit(1)
-    except urllib.error.URLError as e:
+        msg = err.get("message", reason)
+        raise _APIError(f"API error ({status}): {msg}", {"error": msg, "code": status})
+
+    try:
+        return _json_loads()(body)
+    except ValueError as e:
+        msg = f"invalid API response: {e}"
+        raise _APIError(msg, {"error": msg, "code": status}) from None
+
+
+def _api_request(
+    endpoint: str, params: dict, *, use_json_errors: bool = False
+) -> dict:
+    """Like _fetch, but report a failure and exit 1."""
+    try:
+        return _fetch(endpoint, params)
+    except _APIError as e:
         if use_json_errors:
-            json.dump({"error": str(e.reason)}, sys.stdout, indent=2)
-            print()
+            _emit_json(e.payload)
         else:
-            print(f"skillsmp: network error: {e.reason}", file=sys.stderr)
+            print(f"skillsmp: {e}", file=sys.stderr)
         raise SystemExit(1)
 
 
@@ -180,121 +357,230 @@ def _api_request(
 def _format_timestamp(ts: int | None) -> str:
     if not ts:
         return "unknown"
-    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+    return _format_day(ts // 86400)
 
 
+@functools.lru_cache(maxsize=512)
+def _format_day(day: int) -> str:
+    """Format a UTC day number (epoch seconds // 86400) as YYYY-MM-DD."""
+    return time.strftime("%Y-%m-%d", time.gmtime(day * 86400))
+
+
+@functools.lru_cache(maxsize=2048)
 def _format_stars(n: int | None) -> str:
     if n is None:
         return "0"
-    if n >= 1000:
-        return f"{n / 1000:.1f}k"
-    return str(n)
+    if n < 1000:
+        return str(n)
+    return f"{n / 1000:.1f}k"
+
+
+class _Skill:
+    """One search result with defaults applied, shared by every output mode."""
+
+    __slots__ = (
+        "name",
+        "author",
+        "description",
+        "stars",
+        "updated_at",
+        "github_url",
+        "skill_url",
+        "score",
+    )
+
+    def __init__(self, skill: dict, score: float | None = None) -> None:
+        get = skill.get
+        self.name = get("name", "unknown")
+        self.author = get("author", "unknown")
+        self.description = get("description", "")
+        self.stars = get("stars", 0)
+        self.updated_at = get("updatedAt")
+        self.github_url = get("githubUrl", "")
+        self.skill_url = get("skillUrl", "")
+        self.score = score
+
+
+def _semantic_skills(entries: list[dict]) -> list[_Skill]:
+    """Normalize the AI entries that carry skill metadata."""
+    return [
+        _Skill(e["skill"], e.get("score")) for e in entries if e.get("skill")
+    ]
 
 
-def _normalize_skill(skill: dict, score: float | None = None) -> dict:
+def _skill_to_json(skill: _Skill) -> dict:
     d = {
-        "name": skill.get("name", "unknown"),
-        "author": skill.get("author", "unknown"),
-        "description": skill.get("description", ""),
-        "stars": skill.get("stars", 0),
-        "updatedAt": skill.get("updatedAt"),
-        "githubUrl": skill.get("githubUrl", ""),
-        "skillUrl": skill.get("skillUrl", ""),
+        "name": skill.name,
+        "author": skill.author,
+        "description": skill.description,
+        "stars": skill.stars,
+        "updatedAt": skill.updated_at,
+        "githubUrl": skill.github_url,
+        "skillUrl": skill.skill_url,
     }
-    if score is not None:
-        d["relevanceScore"] = round(score, 4)
+    if skill.score is not None:
+        d["relevanceScore"] = round(skill.score, 4)
     return d
 
 
-def _print_skill(skill: dict, score: float | None = None) -> None:
-    name = skill.get("name", "unknown")
-    author = skill.get("author", "unknown")
-    stars = _format_stars(skill.get("stars"))
-    updated = _format_timestamp(skill.get("updatedAt"))
-    desc = skill.get("description", "")
-    github = skill.get("githubUrl", "")
-    skillsmp_url = skill.get("skillUrl", "")
-
-    header = f"  {author}/{name}"
-    if score is not None:
-        header += f"  (relevance: {score:.2f})"
+def _format_skill(skill: _Skill) -> str:
+    """Render one result as a multi-line block for human output."""
+    header = f"  {skill.author}/{skill.name}"
+    if skill.score is not None:
+        header += f"  (relevance: {skill.score:.2f})"
+    stars = _format_stars(skill.stars)
+    updated = _format_timestamp(skill.updated_at)
     header += f"  [{stars} stars, updated {updated}]"
-    print(header)
-    if desc:
-        print(f"    {desc[:DESC_DISPLAY_LIMIT]}")
-    if github:
-        print(f"    github: {github}")
-    if skillsmp_url:
-        print(f"    skillsmp: {skillsmp_url}")
-    print()
-
-
-def _print_skill_plain(skill: dict, score: float | None = None) -> None:
+    lines = [header]
+    if skill.description:
+        lines.append(f"    {skill.description[:DESC_DISPLAY_LIMIT]}")
+    if skill.github_url:
+        lines.append(f"    github: {skill.github_url}")
+    if skill.skill_url:
+        lines.append(f"    skillsmp: {skill.skill_url}")
+    lines.append("\n")
+    return "\n".join(lines)
+
+
+# Tabs and line breaks inside a field would split the TSV row.
+_PLAIN_FIELD_SEPARATORS = str.maketrans("\t\r\n", "   ")
+
+
+def _format_skill_plain(skill: _Skill) -> str:
+    """Render one result as a tab-separated line for --plain output."""
+    desc = skill.description[:DESC_PLAIN_LIMIT]
+    # str.translate is ~40x slower than the membership tests; skip it when clean.
+    if "\t" in desc or "\n" in desc or "\r" in desc:
+        desc = desc.translate(_PLAIN_FIELD_SEPARATORS)
     parts = [
-        f"{skill.get('author', 'unknown')}/{skill.get('name', 'unknown')}",
-        str(skill.get("stars", 0)),
-        skill.get("description", "")[:DESC_PLAIN_LIMIT],
-        skill.get("githubUrl", ""),
+        f"{skill.author}/{skill.name}",
+        str(skill.stars),
+        desc,
+        skill.github_url,
     ]
-    if score is not None:
-        parts.append(str(round(score, 4)))
-    print("\t".join(parts))
+    if skill.score is not None:
+        parts.append(str(round(skill.score, 4)))
+    return "\t".join(parts) + "\n"
 
 
 # --- commands ---
 
 
-def _cmd_search(
-    query: str,
-    *,
-    limit: int = 10,
-    page: int = 1,
-    sort: str = "stars",
-    output_json: bool = False,
-    output_plain: bool = False,
-) -> None:
-    params = {"q": query, "limit": limit, "page": page, "sortBy": sort}
-    result = _api_request("search", params, use_json_errors=output_json)
+def _keyword_payload(query: str, result: dict) -> dict:
     data = result.get("data", {})
-    skills = data.get("skills", [])
     pagination = data.get("pagination", {})
+    return {
+        "query": query,
+        "mode": "keyword",
+        "total": pagination.get("total", 0),
+        "page": pagination.get("page", 1),
+        "totalPages": pagination.get("totalPages", 1),
+        "skills": [_skill_to_json(_Skill(s)) for s in data.get("skills", [])],
+    }
 
-    if output_json:
-        json.dump(
-            {
-                "query": query,
-                "mode": "keyword",
-                "total": pagination.get("total", 0),
-                "page": pagination.get("page", 1),
-                "totalPages": pagination.get("totalPages", 1),
-                "skills": [_normalize_skill(s) for s in skills],
-            },
-            sys.stdout,
-            indent=2,
-        )
-        print()
-        return
 
+def _keyword_plain_rows(result: dict) -> str:
+    skills = result.get("data", {}).get("skills", [])
+    return "".join(_format_skill_plain(_Skill(s)) for s in skills)
+
+
+def _print_keyword_results(
+    query: str,
+    result: dict,
+    *,
+    output_plain: bool = False,
+    out: TextIO | None = None,
+) -> None:
+    """Write one query's human or plain output to out (default: stdout)."""
+    if out is None:
+        out = sys.stdout
     if output_plain:
-        for s in skills:
-            _print_skill_plain(s)
+        out.write(_keyword_plain_rows(result))
         return
 
+    data = result.get("data", {})
+    skills = [_Skill(s) for s in data.get("skills", [])]
+    pagination = data.get("pagination", {})
+
     total = pagination.get("total", 0)
     pg = pagination.get("page", 1)
     total_pages = pagination.get("totalPages", 1)
 
-    print(f'Keyword search: "{query}" — {total} results (page {pg}/{total_pages})\n')
+    header = f'Keyword search: "{query}" — {total} results (page {pg}/{total_pages})\n\n'
     if not skills:
-        print("  No results found.")
+        out.write(header + "  No results found.\n")
         if _stderr_is_tty():
             print(
                 f'\n  Tip: try "skillsmp --ai {query}" for semantic search.',
                 file=sys.stderr,
             )
         return
-    for s in skills:
-        _print_skill(s)
+    out.write(header + "".join(_format_skill(s) for s in skills))
+
+
+def _semantic_payload(query: str, result: dict) -> dict:
+    entries = result.get("data", {}).get("data", [])
+    skills = _semantic_skills(entries)
+    return {
+        "query": query,
+        "mode": "semantic",
+        "total": len(entries),
+        "withMetadata": len(skills),
+        "skills": [_skill_to_json(s) for s in skills],
+    }
+
+
+def _semantic_plain_rows(result: dict) -> str:
+    entries = result.get("data", {}).get("data", [])
+    return "".join(_format_skill_plain(s) for s in _semantic_skills(entries))
+
+
+def _print_semantic_results(
+    query: str,
+    result: dict,
+    *,
+    output_plain: bool = False,
+    out: TextIO | None = None,
+) -> None:
+    """Write one query's human or plain output to out (default: stdout)."""
+    if out is None:
+        out = sys.stdout
+    if output_plain:
+        out.write(_semantic_plain_rows(result))
+        return
+
+    entries = result.get("data", {}).get("data", [])
+    skills = _semantic_skills(entries)
+    skipped = len(entries) - len(skills)
+
+    header = (
+        f'AI search: "{query}" — {len(entries)} results '
+        f"({len(skills)} with metadata)\n\n"
+    )
+    if not entries:
+        out.write(header + "  No results found.\n")
+        return
+    text = header + "".join(_format_skill(s) for s in skills)
+    if skipped:
+        text += f"  ({skipped} additional results without full metadata, skipped)\n"
+    out.write(text)
+
+
+def _cmd_search(
+    query: str,
+    *,
+    limit: int = 10,
+    page: int = 1,
+    sort: str = "stars",
+    output_json: bool = False,
+    output_plain: bool = False,
+) -> None:
+    params = {"q": query, "limit": limit, "page": page, "sortBy": sort}
+    result = _api_request("search", params, use_json_errors=output_json)
+    if output_json:
+        _emit_json(_keyword_payload(query, result))
+    else:
+        _print_keyword_results(query, result, output_plain=output_plain)
 
 
 def _cmd_ai_search(
@@ -305,141 +591,263 @@ def _cmd_ai_search(
 ) -> None:
     params = {"q": query}
     result = _api_request("ai-search", params, use_json_errors=output_json)
-    data = result.get("data", {})
-    entries = data.get("data", [])
+    if output_json:
+        _emit_json(_semantic_payload(query, result))
+    else:
+        _print_semantic_results(query, result, output_plain=output_plain)
 
-    with_skill = [e for e in entries if e.get("skill")]
-    without_skill = [e for e in entries if not e.get("skill")]
 
-    if output_json:
-        json.dump(
-            {
-                "query": query,
-                "mode": "semantic",
-                "total": len(entries),
-                "withMetadata": len(with_skill),
-                "skills": [
-                    _normalize_skill(e["skill"], score=e.get("score"))
-                    for e in with_skill
-                ],
-            },
-            sys.stdout,
-            indent=2,
+def _cmd_batch(
+    queries: list[str],
+    *,
+    mode: str = "search",
+    jobs: int = DEFAULT_JOBS,
+    limit: int = 10,
+    page: int = 1,
+    sort: str = "stars",
+    output_json: bool = False,
+    output_plain: bool = False,
+) -> None:
+    """Run one search per query concurrently; print results in input order.
+
+    A failed query does not stop the others: with --json it becomes an
+    {"query", "error", "code"} entry in the array, otherwise it is
+    reported on stderr. Either way the exit status is 1 afterwards.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Resolve the key up front so a missing key is reported once, not
+    # once per worker.
+    _get_api_key()
+
+    def fetch(query: str) -> dict | _APIError:
+        try:
+            if mode == "ai":
+                return _fetch("ai-search", {"q": query})
+            params = {"q": query, "limit": limit, "page": page, "sortBy": sort}
+            return _fetch("search", params)
+        except _APIError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(queries))) as pool:
+        results = list(pool.map(fetch, queries))
+
+    if mode == "ai":
+        payload, rows, show = (
+            _semantic_payload,
+            _semantic_plain_rows,
+            _print_semantic_results,
+        )
+    else:
+        payload, rows, show = (
+            _keyword_payload,
+            _keyword_plain_rows,
+            _print_keyword_results,
         )
-        print()
-        return
 
-    if output_plain:
-        for entry in with_skill:
-            _print_skill_plain(entry["skill"], score=entry.get("score"))
-        return
+    pairs = list(zip(queries, results))
+    failed = [(q, r) for q, r in pairs if isinstance(r, _APIError)]
+    ok = [(q, r) for q, r in pairs if not isinstance(r, _APIError)]
 
-    print(
-        f'AI search: "{query}" — {len(entries)} results '
-        f"({len(with_skill)} with metadata)\n"
-    )
-    if not entries:
-        print("  No results found.")
-        return
-    for entry in with_skill:
-        _print_skill(entry["skill"], score=entry.get("score"))
-    if without_skill:
-        print(
-            f"  ({len(without_skill)} additional results without full metadata, skipped)"
+    if output_json:
+        _emit_json(
+            [
+                {"query": q, **r.payload} if isinstance(r, _APIError) else payload(q, r)
+                for q, r in pairs
+            ]
         )
+    else:
+        if output_plain:
+            # Every query's rows in one write, however many queries there are.
+            sys.stdout.write("".join(rows(r) for _, r in ok))
+        else:
+            buf = io.StringIO()
+            for q, r in ok:
+                show(q, r, out=buf)
+            sys.stdout.write(buf.getvalue())
+        for q, e in failed:
+            print(f'skillsmp: query "{q}": {e}', file=sys.stderr)
+
+    if failed:
+        raise SystemExit(1)
+
+
+def _read_queries(path: str) -> list[str]:
+    """Read one query per line from path ("-" for stdin), skipping blanks."""
+    try:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+    except OSError as e:
+        _die(f"cannot read --batch file {path}: {e.strerror}")
+    except UnicodeDecodeError:
+        _die(f"cannot read --batch file {path}: not valid UTF-8")
+    queries = [line.strip() for line in text.splitlines() if line.strip()]
+    if not queries:
+        _die(f"no queries found in --batch file {path}")
+    return queries
 
 
 # --- argument parsing ---
 
 
+def _int_value(flag: str, value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        _die(f"{flag} must be a number (got: {value})")
+
+
+def _limit_value(value: str) -> int:
+    n = _int_value("--limit", value)
+    if not 1 <= n <= 100:
+        _die(f"--limit must be 1-100 (got: {n})")
+    return n
+
+
+def _page_value(value: str) -> int:
+    return _int_value("--page", value)
+
+
+def _sort_value(value: str) -> str:
+    if value not in SORT_KEYS:
+        _die(f"--sort must be 'stars' or 'recent' (got: {value})")
+    return value
+
+
+def _jobs_value(value: str) -> int:
+    n = _int_value("--jobs", value)
+    if not 1 <= n <= MAX_JOBS:
+        _die(f"--jobs must be 1-{MAX_JOBS} (got: {n})")
+    return n
+
+
+# Every accepted flag spelling, mapped to (dest, converter). Flags with a
+# converter take a value; the rest are switches or handled specially.
+_FLAGS = {
+    "-h": ("help", None),
+    "--help": ("help", None),
+    "--version": ("version", None),
+    "--": ("end", None),
+    "-a": ("ai", None),
+    "--ai": ("ai", None),
+    "-j": ("json", None),
+    "--json": ("json", None),
+    "--plain": ("plain", None),
+    "-n": ("limit", _limit_value),
+    "--limit": ("limit", _limit_value),
+    "-p": ("page", _page_value),
+    "--page": ("page", _page_value),
+    "-s": ("sort", _sort_value),
+    "--sort": ("sort", _sort_value),
+    "--batch": ("batch", str),
+    "--jobs": ("jobs", _jobs_value),
+}
+
+
+def _info_flag(argv: list[str]) -> str | None:
+    """Return "help" or "version" if either appears before the query, else None.
+
+    Only the flag region is scanned: it ends at the first positional word
+    or "--", and the values of value-taking flags are skipped.
+    """
+    i = 0
+    while i < len(argv):
+        spec = _FLAGS.get(argv[i])
+        if spec is None:
+            if not argv[i].startswith("-"):
+                return None
+        else:
+            dest, convert = spec
+            if dest in ("help", "version"):
+                return dest
+            if dest == "end":
+                return None
+            if convert is not None:
+                i += 1
+        i += 1
+    return None
+
+
 def _parse_args(argv: list[str]) -> dict:
-    mode = "search"
-    limit: int | None = None
-    page: int | None = None
-    sort: str | None = None
-    output_json = False
-    output_plain = False
+    # Bare invocation: concise help before any parsing state is built.
+    if not argv:
+        print(_concise_help(), file=sys.stderr)
+        raise SystemExit(2)
+
+    # --help and --version win over anything else among the flags.
+    info = _info_flag(argv)
+    if info == "help":
+        print(_full_help())
+        raise SystemExit(0)
+    if info == "version":
+        print(f"skillsmp {__version__}")
+        raise SystemExit(0)
+
+    args = {
+        "mode": "search",
+        "query": "",
+        "limit": 10,
+        "page": 1,
+        "sort": "stars",
+        "json": False,
+        "plain": False,
+        "batch": None,
+        "jobs": DEFAULT_JOBS,
+    }
+    # dest -> (converter, raw value); converted once parsing is done.
+    pending: dict[str, tuple[Callable[[str], Any], str]] = {}
     query_parts: list[str] = []
 
     i = 0
     while i < len(argv):
         arg = argv[i]
-        if arg in ("-h", "--help"):
-            print(_full_help())
-            raise SystemExit(0)
-        elif arg == "--version":
-            print(f"skillsmp {__version__}")
-            raise SystemExit(0)
-        elif arg in ("-a", "--ai"):
-            mode = "ai"
-        elif arg in ("-j", "--json"):
-            output_json = True
-        elif arg == "--plain":
-            output_plain = True
-        elif arg in ("-n", "--limit"):
-            i += 1
-            if i >= len(argv):
-                _die(f"flag {arg} requires a value")
-            limit = argv[i]  # type: ignore[assignment]
-        elif arg in ("-s", "--sort"):
-            i += 1
-            if i >= len(argv):
-                _die(f"flag {arg} requires a value")
-            sort = argv[i]
-        elif arg in ("-p", "--page"):
+        spec = _FLAGS.get(arg)
+        if spec is None:
+            if arg.startswith("-"):
+                _die(f"unknown flag: {arg}")
+            query_parts.extend(argv[i:])
+            break
+
+        dest, convert = spec
+        if convert is not None:
             i += 1
             if i >= len(argv):
                 _die(f"flag {arg} requires a value")
-            page = argv[i]  # type: ignore[assignment]
-        elif arg == "--":
-            i += 1
-            query_parts.extend(argv[i:])
+            pending[dest] = (convert, argv[i])
+        elif dest == "end":
+            query_parts.extend(argv[i + 1 :])
             break
-        elif arg.startswith("-"):
-            _die(f"unknown flag: {arg}")
+        elif dest == "ai":
+            args["mode"] = "ai"
         else:
-            query_parts.extend(argv[i:])
-            break
+            args[dest] = True
         i += 1
 
-    # No args at all: concise help.
-    if not query_parts:
+    if "batch" in pending:
+        if query_parts:
+            _die("--batch reads queries from a file; do not also pass a query")
+    elif not query_parts:
+        # Flags but no query: concise help.
         print(_concise_help(), file=sys.stderr)
         raise SystemExit(2)
 
-    # Validate.
-    if output_json and output_plain:
+    if args["json"] and args["plain"]:
         _die("--json and --plain are mutually exclusive")
 
-    if limit is not None:
-        try:
-            limit = int(limit)
-        except ValueError:
-            _die(f"--limit must be a number (got: {limit})")
-        if not 1 <= limit <= 100:
-            _die(f"--limit must be 1-100 (got: {limit})")
+    for key, (converter, value) in pending.items():
+        args[key] = converter(value)
 
-    if page is not None:
-        try:
-            page = int(page)
-        except ValueError:
-            _die(f"--page must be a number (got: {page})")
-
-    if sort is not None and sort not in ("stars", "recent"):
-        _die(f"--sort must be 'stars' or 'recent' (got: {sort})")
-
-    if mode == "ai" and any(x is not None for x in (limit, page, sort)):
+    if args["mode"] == "ai" and not pending.keys().isdisjoint(("limit", "page", "sort")):
         _die("--limit, --page, --sort do not apply to --ai search")
 
-    return {
-        "mode": mode,
-        "query": " ".join(query_parts),
-        "limit": limit if limit is not None else 10,
-        "page": page if page is not None else 1,
-        "sort": sort if sort is not None else "stars",
-        "json": output_json,
-        "plain": output_plain,
-    }
+    if "jobs" in pending and "batch" not in pending:
+        _die("--jobs only applies to --batch")
+
+    args["query"] = " ".join(query_parts)
+    return args
 
 
 # --- entry point ---
@@ -447,6 +855,7 @@ def _parse_args(argv: list[str]) -> dict:
 
 def main() -> None:
     args = _parse_args(sys.argv[1:])
+    queries = _read_queries(args["batch"]) if args["batch"] is not None else None
 
     # Progress indicator for AI search (TTY only, human output only).
     if (
@@ -457,7 +866,18 @@ def main() -> None:
     ):
         print("Searching (AI)...\r", end="", file=sys.stderr, flush=True)
 
-    if args["mode"] == "ai":
+    if queries is not None:
+        _cmd_batch(
+            queries,
+            mode=args["mode"],
+            jobs=args["jobs"],
+            limit=args["limit"],
+            page=args["page"],
+            sort=args["sort"],
+            output_json=args["json"],
+            output_plain=args["plain"],
+        )
+    elif args["mode"] == "ai":
         _cmd_ai_search(
             args["query"],
             output_json=args["json"],
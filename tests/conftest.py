@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 from unittest import mock
 
 import pytest
@@ -10,37 +11,66 @@ import skillsmp
 
 FAKE_API_KEY = "sk-test-1234567890"
 
+# Shared default payloads; treat as read-only. Factories return these
+# directly when called without overrides.
+DEFAULT_SKILL = {
+    "name": "terraform-deploy",
+    "author": "acme",
+    "description": "Deploy infrastructure with Terraform",
+    "stars": 42,
+    "updatedAt": 1700000000,
+    "githubUrl": "https://github.com/acme/terraform-deploy",
+    "skillUrl": "https://skillsmp.com/skills/terraform-deploy",
+}
+DEFAULT_KEYWORD_RESPONSE = {
+    "data": {
+        "skills": [DEFAULT_SKILL],
+        "pagination": {"total": 1, "page": 1, "totalPages": 1},
+    }
+}
+DEFAULT_AI_RESPONSE = {"data": {"data": [{"skill": DEFAULT_SKILL, "score": 0.95}]}}
+
 
 @pytest.fixture(autouse=True)
 def isolate_environment(monkeypatch: pytest.MonkeyPatch) -> None:
     """Isolate process env per test and provide a default API key."""
     monkeypatch.setattr(skillsmp.os, "environ", dict(os.environ))
     monkeypatch.setenv("SKILLSMP_API_KEY", FAKE_API_KEY)
+    # Connect directly unless a test opts into a proxy.
+    for name in ("HTTPS_PROXY", "https_proxy", "NO_PROXY", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    skillsmp._reset_api_key_cache()
+    monkeypatch.setattr(skillsmp, "_stderr_tty", None)
+    monkeypatch.setattr(skillsmp, "_local", threading.local())
+
+
+@pytest.fixture
+def tty(monkeypatch: pytest.MonkeyPatch):
+    """Return a setter that controls what ``skillsmp._stderr_is_tty`` reports."""
+    state = {"value": False}
+    monkeypatch.setattr(skillsmp, "_stderr_is_tty", lambda: state["value"])
+
+    def _set(value: bool) -> None:
+        state["value"] = value
+
+    return _set
 
 
 @pytest.fixture
 def make_skill():
     def _make_skill(**overrides):
-        base = {
-            "name": "terraform-deploy",
-            "author": "acme",
-            "description": "Deploy infrastructure with Terraform",
-            "stars": 42,
-            "updatedAt": 1700000000,
-            "githubUrl": "https://github.com/acme/terraform-deploy",
-            "skillUrl": "https://skillsmp.com/skills/terraform-deploy",
-        }
-        base.update(overrides)
-        return base
+        return {**DEFAULT_SKILL, **overrides}
 
     return _make_skill
 
 
 @pytest.fixture
-def make_keyword_response(make_skill):
+def make_keyword_response():
     def _make_keyword_response(skills=None, total=1, page=1, total_pages=1):
         if skills is None:
-            skills = [make_skill()]
+            if (total, page, total_pages) == (1, 1, 1):
+                return DEFAULT_KEYWORD_RESPONSE
+            skills = [DEFAULT_SKILL]
         return {
             "data": {
                 "skills": skills,
@@ -56,22 +86,55 @@ def make_keyword_response(make_skill):
 
 
 @pytest.fixture
-def make_ai_response(make_skill):
+def make_ai_response():
     def _make_ai_response(entries=None):
         if entries is None:
-            entries = [{"skill": make_skill(), "score": 0.95}]
+            return DEFAULT_AI_RESPONSE
         return {"data": {"data": entries}}
 
     return _make_ai_response
 
 
 @pytest.fixture
-def mock_urlopen():
-    def _mock_urlopen(response_data: dict):
-        body = json.dumps(response_data).encode()
-        response = mock.MagicMock()
-        response.__enter__.return_value = response
+def mock_connection():
+    def _mock_connection(
+        response_data: dict | None = None,
+        *,
+        status: int = 200,
+        reason: str = "OK",
+        body: bytes | None = None,
+        error: BaseException | None = None,
+    ):
+        if body is None:
+            body = json.dumps(response_data).encode()
+        response = mock.MagicMock(status=status, reason=reason)
         response.read.return_value = body
-        return mock.patch("skillsmp.urllib.request.urlopen", return_value=response)
+        conn = mock.MagicMock()
+        conn.getresponse.return_value = response
+        if error is not None:
+            conn.getresponse.side_effect = error
+        return mock.patch("http.client.HTTPSConnection", return_value=conn)
+
+    return _mock_connection
 
-    return _mock_urlopen
+
+@pytest.fixture
+def mock_http_error(mock_connection):
+    """Patch the connection to answer with an API error status.
+
+    ``message`` is wrapped in the API's ``{"error": {"message": ...}}``
+    envelope; pass ``body`` instead to send raw bytes.
+    """
+
+    def _mock_http_error(
+        status: int,
+        reason: str,
+        message: str | None = None,
+        *,
+        body: bytes = b"",
+    ):
+        if message is not None:
+            body = json.dumps({"error": {"message": message}}).encode()
+        return mock_connection(status=status, reason=reason, body=body)
+
+    return _mock_http_error